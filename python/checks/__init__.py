@@ -128,14 +128,18 @@ all_checks = [
 # Quick checks for smoke testing
 quick_checks = [c for c in all_checks if c.quick]
 
+# Lowercased names for --only matching, computed once
+_check_names = [(c.name.lower(), c) for c in all_checks]
+
 
 def get_checks_by_name(names: list) -> list:
     """Get checks by name (case-insensitive, partial match)."""
     result = []
+    seen = set()
     for name in names:
         name_lower = name.lower().strip()
-        for check in all_checks:
-            if name_lower in check.name.lower():
-                if check not in result:
-                    result.append(check)
+        for check_name, check in _check_names:
+            if name_lower in check_name and check.name not in seen:
+                seen.add(check.name)
+                result.append(check)
     return result
@@ -1,6 +1,6 @@
 """Balance check."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field
 
 
 async def _balance_get_check(ctx: CheckContext) -> CheckResult:
@@ -16,12 +16,12 @@ async def _balance_get_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         balance = client.get_balance(customer_id)
 
         # Handle different response formats
-        balance_usdc = getattr(balance, 'balance_usdc', getattr(balance, 'balance', 'N/A'))
-        available_usdc = getattr(balance, 'available_usdc', getattr(balance, 'available', balance_usdc))
+        balance_usdc = get_field(balance, 'balance_usdc', 'balance', default='N/A')
+        available_usdc = get_field(balance, 'available_usdc', 'available', default=balance_usdc)
 
         return CheckResult(
             name="balance_get",
@@ -1,6 +1,6 @@
 """Charge operation checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client, generate_idempotency_key
+from ..drip_client import create_client, generate_idempotency_key, get_field, list_items
 
 
 async def _charge_create_check(ctx: CheckContext) -> CheckResult:
@@ -16,7 +16,7 @@ async def _charge_create_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         idempotency_key = generate_idempotency_key("charge")
 
         result = client.charge(
@@ -28,13 +28,13 @@ async def _charge_create_check(ctx: CheckContext) -> CheckResult:
         )
 
         # Handle different response formats
-        if hasattr(result, 'charge'):
-            charge = result.charge
-            charge_id = charge.id
-            amount = getattr(charge, 'amount_usdc', getattr(charge, 'amount', 'N/A'))
+        charge = get_field(result, 'charge')
+        if charge is not None:
+            charge_id = get_field(charge, 'id')
+            amount = get_field(charge, 'amount_usdc', 'amount', default='N/A')
         else:
-            charge_id = getattr(result, 'id', str(result))
-            amount = getattr(result, 'amount_usdc', getattr(result, 'amount', 'N/A'))
+            charge_id = get_field(result, 'id', default=str(result))
+            amount = get_field(result, 'amount_usdc', 'amount', default='N/A')
 
         # Store charge ID for status check
         ctx.created_charge_id = charge_id
@@ -75,17 +75,17 @@ async def _charge_status_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Try get_charge_status or get_charge
         if hasattr(client, 'get_charge_status'):
             status = client.get_charge_status(ctx.created_charge_id)
-            status_str = getattr(status, 'status', str(status))
-            settlement = getattr(status, 'settlement_tx', None) or 'pending'
+            status_str = get_field(status, 'status', default=str(status))
+            settlement = get_field(status, 'settlement_tx') or 'pending'
         elif hasattr(client, 'get_charge'):
             charge = client.get_charge(ctx.created_charge_id)
-            status_str = getattr(charge, 'status', 'unknown')
-            settlement = getattr(charge, 'settlement_tx', None) or 'pending'
+            status_str = get_field(charge, 'status', default='unknown')
+            settlement = get_field(charge, 'settlement_tx') or 'pending'
         else:
             return CheckResult(
                 name="charge_status",
@@ -131,7 +131,7 @@ async def _get_charge_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'get_charge'):
             return CheckResult(
@@ -143,8 +143,8 @@ async def _get_charge_check(ctx: CheckContext) -> CheckResult:
             )
 
         charge = client.get_charge(charge_id)
-        status = getattr(charge, 'status', 'unknown')
-        amount = getattr(charge, 'amount_usdc', getattr(charge, 'amount', 'N/A'))
+        status = get_field(charge, 'status', default='unknown')
+        amount = get_field(charge, 'amount_usdc', 'amount', default='N/A')
 
         return CheckResult(
             name="charge_get",
@@ -191,7 +191,7 @@ async def _list_charges_filtered_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'list_charges'):
             return CheckResult(
@@ -205,19 +205,14 @@ async def _list_charges_filtered_check(ctx: CheckContext) -> CheckResult:
         result = client.list_charges(customer_id=customer_id, limit=10)
 
         # Handle different response formats
-        if hasattr(result, 'data'):
-            count = len(result.data)
+        items = list_items(result)
+        if items is not None:
+            count = len(items)
             # Store first charge ID for subsequent checks
             if count > 0 and not ctx.charge_id:
-                ctx.charge_id = result.data[0].id
-        elif hasattr(result, 'count'):
-            count = result.count
-        elif isinstance(result, list):
-            count = len(result)
-            if count > 0 and not ctx.charge_id:
-                ctx.charge_id = result[0].id if hasattr(result[0], 'id') else result[0].get('id')
+                ctx.charge_id = get_field(items[0], 'id')
         else:
-            count = 1
+            count = get_field(result, 'count', default=1)
 
         return CheckResult(
             name="charge_list_filtered",
@@ -1,6 +1,6 @@
 """Checkout operation checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field
 
 
 async def _checkout_create_check(ctx: CheckContext) -> CheckResult:
@@ -16,7 +16,7 @@ async def _checkout_create_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'checkout') and not hasattr(client, 'create_checkout'):
             return CheckResult(
@@ -35,8 +35,8 @@ async def _checkout_create_check(ctx: CheckContext) -> CheckResult:
             return_url="https://example.com/checkout/success"
         )
 
-        session_id = getattr(result, 'id', str(result))
-        url = getattr(result, 'url', 'N/A')
+        session_id = get_field(result, 'id', default=str(result))
+        url = get_field(result, 'url', default='N/A')
 
         return CheckResult(
             name="checkout_create",
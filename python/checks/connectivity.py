@@ -6,7 +6,7 @@ from ..drip_client import create_client
 async def _connectivity_check(ctx: CheckContext) -> CheckResult:
     """Verify SDK can reach the API."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Try to ping or make a basic request
         if hasattr(client, 'ping'):
@@ -49,7 +49,7 @@ connectivity_check = Check(
 async def _authentication_check(ctx: CheckContext) -> CheckResult:
     """Verify API key is valid."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         # Make an authenticated request
         client.list_customers(limit=1)
         return CheckResult(
@@ -1,6 +1,6 @@
 """Customer CRUD checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client, generate_external_id
+from ..drip_client import create_client, generate_external_id, get_field, list_items
 
 
 async def _customer_create_check(ctx: CheckContext) -> CheckResult:
@@ -16,7 +16,7 @@ async def _customer_create_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         external_id = generate_external_id("health_check")
 
         customer = client.create_customer(
@@ -75,7 +75,7 @@ async def _customer_get_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         customer = client.get_customer(customer_id)
 
         return CheckResult(
@@ -83,7 +83,7 @@ async def _customer_get_check(ctx: CheckContext) -> CheckResult:
             success=True,
             duration=0,
             message=f"Retrieved customer {customer.id}",
-            details=f"address: {getattr(customer, 'onchain_address', 'N/A')}"
+            details=f"address: {get_field(customer, 'onchain_address', default='N/A')}"
         )
     except Exception as e:
         return CheckResult(
@@ -104,16 +104,12 @@ customer_get_check = Check(
 async def _customer_list_check(ctx: CheckContext) -> CheckResult:
     """List customers with filtering."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         result = client.list_customers(limit=10)
 
         # Handle different response formats
-        if hasattr(result, 'customers'):
-            count = len(result.customers)
-        elif isinstance(result, list):
-            count = len(result)
-        else:
-            count = 1
+        items = list_items(result, 'customers')
+        count = len(items) if items is not None else 1
 
         return CheckResult(
             name="customer_list",
@@ -156,7 +152,7 @@ async def _customer_cleanup_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Try to delete customer if SDK supports it
         if hasattr(client, 'delete_customer'):
@@ -1,7 +1,9 @@
 """Cost estimation checks."""
 from datetime import datetime, timedelta
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field
+
+_ESTIMATE_PERIOD = timedelta(days=30)
 
 
 async def _estimate_from_usage_check(ctx: CheckContext) -> CheckResult:
@@ -17,7 +19,7 @@ async def _estimate_from_usage_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'estimate_from_usage'):
             return CheckResult(
@@ -28,8 +30,9 @@ async def _estimate_from_usage_check(ctx: CheckContext) -> CheckResult:
                 details="The estimate_from_usage method is not available in the SDK"
             )
 
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        start_date = (now - _ESTIMATE_PERIOD).strftime('%Y-%m-%d')
 
         result = client.estimate_from_usage(
             period_start=start_date,
@@ -37,8 +40,8 @@ async def _estimate_from_usage_check(ctx: CheckContext) -> CheckResult:
             customer_id=customer_id
         )
 
-        estimated_cost = getattr(result, 'estimated_cost', getattr(result, 'estimatedCost', 'N/A'))
-        currency = getattr(result, 'currency', 'USD')
+        estimated_cost = get_field(result, 'estimated_cost', 'estimatedCost', default='N/A')
+        currency = get_field(result, 'currency', default='USD')
 
         return CheckResult(
             name="estimate_from_usage",
@@ -75,7 +78,7 @@ estimate_from_usage_check = Check(
 async def _estimate_from_hypothetical_check(ctx: CheckContext) -> CheckResult:
     """Estimate hypothetical costs."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'estimate_from_hypothetical'):
             return CheckResult(
@@ -93,9 +96,9 @@ async def _estimate_from_hypothetical_check(ctx: CheckContext) -> CheckResult:
             ]
         )
 
-        estimated_cost = getattr(result, 'estimated_cost', getattr(result, 'estimatedCost', 'N/A'))
-        currency = getattr(result, 'currency', 'USD')
-        breakdown = getattr(result, 'breakdown', [])
+        estimated_cost = get_field(result, 'estimated_cost', 'estimatedCost', default='N/A')
+        currency = get_field(result, 'currency', default='USD')
+        breakdown = get_field(result, 'breakdown', default=[])
 
         return CheckResult(
             name="estimate_hypothetical",
@@ -1,6 +1,6 @@
 """Idempotency check."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client, generate_idempotency_key
+from ..drip_client import create_client, generate_idempotency_key, get_field
 
 
 async def _idempotency_check(ctx: CheckContext) -> CheckResult:
@@ -15,34 +15,29 @@ async def _idempotency_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         idempotency_key = generate_idempotency_key("idem_test")
+        charge_kwargs = {
+            "customer_id": customer_id,
+            "meter": "api_calls",
+            "quantity": 1,
+            "idempotency_key": idempotency_key,
+        }
 
-        # First charge
-        result1 = client.charge(
-            customer_id=customer_id,
-            meter="api_calls",
-            quantity=1,
-            idempotency_key=idempotency_key
-        )
-
-        # Second charge with same key
-        result2 = client.charge(
-            customer_id=customer_id,
-            meter="api_calls",
-            quantity=1,
-            idempotency_key=idempotency_key
-        )
+        # First charge, then a second charge with the same key
+        result1 = client.charge(**charge_kwargs)
+        result2 = client.charge(**charge_kwargs)
 
         # Get charge IDs
-        if hasattr(result1, 'charge'):
-            charge_id_1 = result1.charge.id
-            charge_id_2 = result2.charge.id
-            is_replay = getattr(result2, 'is_replay', False)
+        charge1 = get_field(result1, 'charge')
+        if charge1 is not None:
+            charge_id_1 = get_field(charge1, 'id')
+            charge_id_2 = get_field(get_field(result2, 'charge'), 'id')
+            is_replay = get_field(result2, 'is_replay', default=False)
         else:
-            charge_id_1 = getattr(result1, 'id', str(result1))
-            charge_id_2 = getattr(result2, 'id', str(result2))
-            is_replay = getattr(result2, 'is_replay', charge_id_1 == charge_id_2)
+            charge_id_1 = get_field(result1, 'id', default=str(result1))
+            charge_id_2 = get_field(result2, 'id', default=str(result2))
+            is_replay = get_field(result2, 'is_replay', default=charge_id_1 == charge_id_2)
 
         # Verify replay detection
         if is_replay or charge_id_1 == charge_id_2:
@@ -1,12 +1,12 @@
 """Meter operation checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field, list_items
 
 
 async def _list_meters_check(ctx: CheckContext) -> CheckResult:
     """List available meters."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'list_meters'):
             return CheckResult(
@@ -19,12 +19,10 @@ async def _list_meters_check(ctx: CheckContext) -> CheckResult:
 
         result = client.list_meters()
 
-        if hasattr(result, 'data'):
-            count = len(result.data)
-            meters = [getattr(m, 'name', str(m)) for m in result.data[:3]]
-        elif isinstance(result, list):
-            count = len(result)
-            meters = [getattr(m, 'name', str(m)) for m in result[:3]]
+        items = list_items(result)
+        if items is not None:
+            count = len(items)
+            meters = [get_field(m, 'name', default=str(m)) for m in items[:3]]
         else:
             count = 1
             meters = [str(result)]
@@ -1,12 +1,12 @@
 """Resilience and metrics checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field
 
 
 async def _get_metrics_check(ctx: CheckContext) -> CheckResult:
     """Get SDK metrics."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'get_metrics'):
             return CheckResult(
@@ -28,7 +28,7 @@ async def _get_metrics_check(ctx: CheckContext) -> CheckResult:
                 details="Enable resilience to get metrics"
             )
 
-        total_requests = metrics.get('total_requests', 0) if isinstance(metrics, dict) else getattr(metrics, 'total_requests', 0)
+        total_requests = get_field(metrics, 'total_requests', default=0)
 
         return CheckResult(
             name="sdk_metrics",
@@ -65,7 +65,7 @@ get_metrics_check = Check(
 async def _get_health_check(ctx: CheckContext) -> CheckResult:
     """Get resilience health status."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'get_health'):
             return CheckResult(
@@ -87,10 +87,7 @@ async def _get_health_check(ctx: CheckContext) -> CheckResult:
                 details="Enable resilience to get health status"
             )
 
-        if isinstance(health, dict):
-            status = health.get('healthy', health.get('status', 'unknown'))
-        else:
-            status = getattr(health, 'healthy', getattr(health, 'status', 'unknown'))
+        status = get_field(health, 'healthy', 'status', default='unknown')
 
         return CheckResult(
             name="resilience_health",
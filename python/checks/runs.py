@@ -1,7 +1,7 @@
 """Execution run checks."""
-import uuid
+import os
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field, list_items
 
 
 async def _run_create_check(ctx: CheckContext) -> CheckResult:
@@ -16,7 +16,7 @@ async def _run_create_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Check if SDK supports runs
         if not hasattr(client, 'start_run') and not hasattr(client, 'record_run'):
@@ -28,8 +28,8 @@ async def _run_create_check(ctx: CheckContext) -> CheckResult:
                 details="Skipping run tests"
             )
 
-        workflow_slug = f"health-check-{uuid.uuid4().hex[:8]}"
-        correlation_id = f"health_{uuid.uuid4().hex[:8]}"
+        workflow_slug = f"health-check-{os.urandom(4).hex()}"
+        correlation_id = f"health_{os.urandom(4).hex()}"
 
         # Try record_run first (if endpoint exists)
         record_run_failed = False
@@ -48,8 +48,8 @@ async def _run_create_check(ctx: CheckContext) -> CheckResult:
                         }
                     ]
                 )
-                run_info = getattr(result, 'run', result)
-                run_id = getattr(run_info, 'id', str(result))
+                run_info = get_field(result, 'run', default=result)
+                run_id = get_field(run_info, 'id', default=str(result))
                 ctx.run_id = run_id
 
                 return CheckResult(
@@ -164,7 +164,7 @@ async def _run_timeline_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'get_run_timeline'):
             return CheckResult(
@@ -178,12 +178,8 @@ async def _run_timeline_check(ctx: CheckContext) -> CheckResult:
         timeline = client.get_run_timeline(ctx.run_id)
 
         # Handle different response formats
-        if hasattr(timeline, 'events'):
-            event_count = len(timeline.events)
-        elif isinstance(timeline, list):
-            event_count = len(timeline)
-        else:
-            event_count = 1
+        events = list_items(timeline, 'events')
+        event_count = len(events) if events is not None else 1
 
         return CheckResult(
             name="run_timeline",
@@ -219,7 +215,7 @@ async def _run_end_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'end_run'):
             return CheckResult(
@@ -276,7 +272,7 @@ async def _emit_event_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'emit_event'):
             return CheckResult(
@@ -338,7 +334,7 @@ async def _emit_events_batch_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'emit_events_batch') and not hasattr(client, 'emit_events'):
             return CheckResult(
@@ -356,7 +352,7 @@ async def _emit_events_batch_check(ctx: CheckContext) -> CheckResult:
             {"runId": ctx.run_id, "eventType": "tool_call", "quantity": 1, "units": "calls", "description": "Calc tool call"}
         ])
 
-        count = getattr(result, 'created', getattr(result, 'count', 2))
+        count = get_field(result, 'created', 'count', default=2)
 
         return CheckResult(
             name="emit_events_batch",
@@ -402,7 +398,7 @@ async def _record_run_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'record_run'):
             return CheckResult(
@@ -413,12 +409,12 @@ async def _record_run_check(ctx: CheckContext) -> CheckResult:
                 details="The record_run method is not available in the SDK"
             )
 
-        workflow_slug = f"record-run-{uuid.uuid4().hex[:8]}"
+        workflow_slug = f"record-run-{os.urandom(4).hex()}"
 
         result = client.record_run(
             customer_id=customer_id,
             workflow=workflow_slug,
-            correlation_id=f"health_{uuid.uuid4().hex[:8]}",
+            correlation_id=f"health_{os.urandom(4).hex()}",
             status="COMPLETED",
             events=[
                 {"eventType": "llm_call", "quantity": 100, "units": "tokens"},
@@ -426,7 +422,7 @@ async def _record_run_check(ctx: CheckContext) -> CheckResult:
             ]
         )
 
-        run_id = getattr(result, 'id', getattr(result, 'run_id', str(result)))
+        run_id = get_field(result, 'id', 'run_id', default=str(result))
 
         return CheckResult(
             name="record_run",
@@ -1,6 +1,6 @@
 """StreamMeter checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client, generate_idempotency_key
+from ..drip_client import create_client, generate_idempotency_key, get_field
 
 
 async def _stream_meter_add_check(ctx: CheckContext) -> CheckResult:
@@ -15,7 +15,7 @@ async def _stream_meter_add_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         idempotency_key = generate_idempotency_key("stream")
 
         # Check if SDK supports stream meters
@@ -87,12 +87,10 @@ async def _stream_meter_flush_check(ctx: CheckContext) -> CheckResult:
         result = ctx.stream_meter.flush()
 
         # Handle different response formats
-        if hasattr(result, 'charge') and result.charge:
-            charge_id = result.charge.id
-        else:
-            charge_id = 'none'
+        charge = get_field(result, 'charge')
+        charge_id = get_field(charge, 'id') if charge is not None else 'none'
 
-        total_flushed = getattr(result, 'total_flushed', getattr(result, 'total', 'N/A'))
+        total_flushed = get_field(result, 'total_flushed', 'total', default='N/A')
 
         return CheckResult(
             name="stream_meter_flush",
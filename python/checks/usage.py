@@ -1,8 +1,8 @@
 """Usage tracking check."""
+import os
 import time
-import uuid
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field
 
 
 async def _track_usage_check(ctx: CheckContext) -> CheckResult:
@@ -17,7 +17,7 @@ async def _track_usage_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'track_usage'):
             return CheckResult(
@@ -71,7 +71,7 @@ async def _track_usage_idempotency_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'track_usage'):
             return CheckResult(
@@ -82,30 +82,24 @@ async def _track_usage_idempotency_check(ctx: CheckContext) -> CheckResult:
                 details="Skipping idempotency test"
             )
 
-        idempotency_key = f"health-check-usage-idem-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        idempotency_key = f"health-check-usage-idem-{int(time.time())}-{os.urandom(4).hex()}"
 
-        # First call with idempotency key
-        result1 = client.track_usage(
-            customer_id=customer_id,
-            meter="api_calls",
-            quantity=5,
-            units="requests",
-            description="Idempotency test usage",
-            idempotency_key=idempotency_key,
-        )
+        usage_kwargs = {
+            "customer_id": customer_id,
+            "meter": "api_calls",
+            "quantity": 5,
+            "units": "requests",
+            "description": "Idempotency test usage",
+            "idempotency_key": idempotency_key,
+        }
 
-        # Second call with same idempotency key - should return same event
-        result2 = client.track_usage(
-            customer_id=customer_id,
-            meter="api_calls",
-            quantity=5,
-            units="requests",
-            description="Idempotency test usage",
-            idempotency_key=idempotency_key,
-        )
+        # First call with idempotency key, then a second call with the same
+        # key - should return same event
+        result1 = client.track_usage(**usage_kwargs)
+        result2 = client.track_usage(**usage_kwargs)
 
-        event_id_1 = getattr(result1, 'usage_event_id', str(result1))
-        event_id_2 = getattr(result2, 'usage_event_id', str(result2))
+        event_id_1 = get_field(result1, 'usage_event_id', default=str(result1))
+        event_id_2 = get_field(result2, 'usage_event_id', default=str(result2))
 
         if event_id_1 == event_id_2:
             return CheckResult(
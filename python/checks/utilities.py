@@ -21,7 +21,7 @@ async def _generate_idempotency_key_check(ctx: CheckContext) -> CheckResult:
             )
 
         # Also test SDK static method if available
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
         sdk_method = getattr(client, 'generate_idempotency_key', None) or getattr(type(client), 'generate_idempotency_key', None)
 
         if sdk_method:
@@ -83,7 +83,7 @@ generate_idempotency_key_check = Check(
 async def _create_stream_meter_check(ctx: CheckContext) -> CheckResult:
     """Create stream meter instance."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Check for StreamMeter class or create_stream_meter method
         stream_meter_class = getattr(client, 'StreamMeter', None)
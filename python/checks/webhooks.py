@@ -1,15 +1,16 @@
 """Webhook checks."""
-import uuid
+import os
 import hmac
 import hashlib
+import time
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field, verify_webhook_signature
 
 
 async def _webhook_sign_check(ctx: CheckContext) -> CheckResult:
     """Create a webhook and get signing secret."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         # Check if SDK supports webhooks
         if not hasattr(client, 'create_webhook'):
@@ -22,14 +23,14 @@ async def _webhook_sign_check(ctx: CheckContext) -> CheckResult:
             )
 
         webhook = client.create_webhook(
-            url=f"https://example.com/webhook/{uuid.uuid4().hex}",
+            url=f"https://example.com/webhook/{os.urandom(16).hex()}",
             events=["charge.succeeded", "customer.balance.low"],
             description="Health check webhook"
         )
 
         # Store for verify check
         ctx.webhook_id = webhook.id
-        ctx.webhook_secret = getattr(webhook, 'secret', None)
+        ctx.webhook_secret = get_field(webhook, 'secret')
 
         return CheckResult(
             name="webhook_sign",
@@ -57,8 +58,6 @@ webhook_sign_check = Check(
 
 async def _webhook_verify_check(ctx: CheckContext) -> CheckResult:
     """Verify webhook signature validation."""
-    import time
-
     if not ctx.webhook_secret:
         return CheckResult(
             name="webhook_verify",
@@ -86,15 +85,14 @@ async def _webhook_verify_check(ctx: CheckContext) -> CheckResult:
         # Format signature as SDK expects: t=timestamp,v1=hexsignature
         formatted_signature = f"t={timestamp},v1={hex_signature}"
 
-        # Try to use SDK's verify function if available
-        try:
-            from drip import verify_webhook_signature
+        # Use SDK's verify function if available
+        if verify_webhook_signature is not None:
             is_valid = verify_webhook_signature(
                 payload=test_payload,
                 signature=formatted_signature,
                 secret=ctx.webhook_secret
             )
-        except ImportError:
+        else:
             # Fallback: manually verify using same logic
             expected_sig = hmac.new(
                 ctx.webhook_secret.encode(),
@@ -128,7 +126,7 @@ async def _webhook_verify_check(ctx: CheckContext) -> CheckResult:
         # Cleanup webhook
         if ctx.webhook_id:
             try:
-                client = create_client(ctx.api_key, ctx.api_url)
+                client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
                 if hasattr(client, 'delete_webhook'):
                     client.delete_webhook(ctx.webhook_id)
             except Exception:
@@ -1,13 +1,13 @@
 """Webhook CRUD operation checks."""
-import uuid
+import os
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field, list_items
 
 
 async def _webhook_create_check(ctx: CheckContext) -> CheckResult:
     """Create a webhook endpoint."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'create_webhook'):
             return CheckResult(
@@ -18,14 +18,14 @@ async def _webhook_create_check(ctx: CheckContext) -> CheckResult:
                 details="The create_webhook method is not available in the SDK"
             )
 
-        webhook_url = f"https://webhook.site/health-check-{uuid.uuid4().hex[:8]}"
+        webhook_url = f"https://webhook.site/health-check-{os.urandom(4).hex()}"
         result = client.create_webhook(
             url=webhook_url,
             events=["charge.succeeded", "customer.balance.low"]
         )
 
-        webhook_id = getattr(result, 'id', str(result))
-        secret = getattr(result, 'secret', None)
+        webhook_id = get_field(result, 'id', default=str(result))
+        secret = get_field(result, 'secret')
 
         ctx.webhook_id = webhook_id
         if secret:
@@ -66,7 +66,7 @@ webhook_create_check = Check(
 async def _webhook_list_check(ctx: CheckContext) -> CheckResult:
     """List all webhooks."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'list_webhooks'):
             return CheckResult(
@@ -79,12 +79,8 @@ async def _webhook_list_check(ctx: CheckContext) -> CheckResult:
 
         result = client.list_webhooks()
 
-        if hasattr(result, 'data'):
-            count = len(result.data)
-        elif isinstance(result, list):
-            count = len(result)
-        else:
-            count = 1
+        items = list_items(result)
+        count = len(items) if items is not None else 1
 
         return CheckResult(
             name="webhook_list",
@@ -129,7 +125,7 @@ async def _webhook_get_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'get_webhook'):
             return CheckResult(
@@ -141,7 +137,7 @@ async def _webhook_get_check(ctx: CheckContext) -> CheckResult:
             )
 
         webhook = client.get_webhook(ctx.webhook_id)
-        url = getattr(webhook, 'url', 'N/A')
+        url = get_field(webhook, 'url', default='N/A')
 
         return CheckResult(
             name="webhook_get",
@@ -187,7 +183,7 @@ async def _webhook_test_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'test_webhook'):
             return CheckResult(
@@ -199,7 +195,7 @@ async def _webhook_test_check(ctx: CheckContext) -> CheckResult:
             )
 
         result = client.test_webhook(ctx.webhook_id)
-        sent = getattr(result, 'sent', getattr(result, 'success', True))
+        sent = get_field(result, 'sent', 'success', default=True)
 
         return CheckResult(
             name="webhook_test",
@@ -244,7 +240,7 @@ async def _webhook_rotate_secret_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'rotate_webhook_secret'):
             return CheckResult(
@@ -256,7 +252,7 @@ async def _webhook_rotate_secret_check(ctx: CheckContext) -> CheckResult:
             )
 
         result = client.rotate_webhook_secret(ctx.webhook_id)
-        new_secret = getattr(result, 'secret', 'rotated')
+        new_secret = get_field(result, 'secret', default='rotated')
 
         return CheckResult(
             name="webhook_rotate_secret",
@@ -302,7 +298,7 @@ async def _webhook_delete_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'delete_webhook'):
             return CheckResult(
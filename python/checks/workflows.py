@@ -1,13 +1,13 @@
 """Workflow operation checks."""
-import uuid
+import os
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client
+from ..drip_client import create_client, get_field, list_items
 
 
 async def _workflow_create_check(ctx: CheckContext) -> CheckResult:
     """Create workflow definition."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'create_workflow'):
             return CheckResult(
@@ -18,14 +18,14 @@ async def _workflow_create_check(ctx: CheckContext) -> CheckResult:
                 details="The create_workflow method is not available in the SDK"
             )
 
-        workflow_slug = f"health-check-{uuid.uuid4().hex[:8]}"
+        workflow_slug = f"health-check-{os.urandom(4).hex()}"
         result = client.create_workflow(
             name=f"Health Check Workflow {workflow_slug}",
             slug=workflow_slug,
             description="Test workflow created by health check"
         )
 
-        workflow_id = getattr(result, 'id', str(result))
+        workflow_id = get_field(result, 'id', default=str(result))
         ctx.workflow_id = workflow_id
 
         return CheckResult(
@@ -63,7 +63,7 @@ workflow_create_check = Check(
 async def _workflow_list_check(ctx: CheckContext) -> CheckResult:
     """List all workflows."""
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'list_workflows'):
             return CheckResult(
@@ -76,14 +76,11 @@ async def _workflow_list_check(ctx: CheckContext) -> CheckResult:
 
         result = client.list_workflows()
 
-        if hasattr(result, 'data'):
-            count = len(result.data)
+        items = list_items(result)
+        if items is not None:
+            count = len(items)
             if count > 0 and not ctx.workflow_id:
-                ctx.workflow_id = result.data[0].id
-        elif isinstance(result, list):
-            count = len(result)
-            if count > 0 and not ctx.workflow_id:
-                ctx.workflow_id = result[0].id if hasattr(result[0], 'id') else result[0].get('id')
+                ctx.workflow_id = get_field(items[0], 'id')
         else:
             count = 1
 
@@ -1,6 +1,6 @@
 """Wrap API call checks."""
 from ..types import Check, CheckContext, CheckResult
-from ..drip_client import create_client, generate_idempotency_key
+from ..drip_client import create_client, generate_idempotency_key, get_field
 
 
 async def _wrap_api_call_basic_check(ctx: CheckContext) -> CheckResult:
@@ -15,7 +15,7 @@ async def _wrap_api_call_basic_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'wrap_api_call'):
             return CheckResult(
@@ -40,11 +40,11 @@ async def _wrap_api_call_basic_check(ctx: CheckContext) -> CheckResult:
         )
 
         # Handle different response formats
-        api_result = getattr(result, 'api_result', result)
-        charge = getattr(result, 'charge', None)
+        api_result = get_field(result, 'api_result', default=result)
+        charge = get_field(result, 'charge')
 
         if isinstance(api_result, dict) and api_result.get("result") == "success":
-            charge_id = charge.id if charge else "N/A"
+            charge_id = get_field(charge, 'id') if charge is not None else "N/A"
             return CheckResult(
                 name="wrap_api_call_basic",
                 success=True,
@@ -88,7 +88,7 @@ async def _wrap_api_call_idempotency_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'wrap_api_call'):
             return CheckResult(
@@ -104,27 +104,21 @@ async def _wrap_api_call_idempotency_check(ctx: CheckContext) -> CheckResult:
         def mock_api():
             return {"tokens": 100}
 
-        # First call
-        result1 = client.wrap_api_call(
-            customer_id=customer_id,
-            meter="tokens",
-            call=mock_api,
-            extract_usage=lambda r: r["tokens"],
-            idempotency_key=idempotency_key
-        )
+        wrap_kwargs = {
+            "customer_id": customer_id,
+            "meter": "tokens",
+            "call": mock_api,
+            "extract_usage": lambda r: r["tokens"],
+            "idempotency_key": idempotency_key,
+        }
 
-        # Second call with same key
-        result2 = client.wrap_api_call(
-            customer_id=customer_id,
-            meter="tokens",
-            call=mock_api,
-            extract_usage=lambda r: r["tokens"],
-            idempotency_key=idempotency_key
-        )
+        # First call, then a second call with the same key
+        result1 = client.wrap_api_call(**wrap_kwargs)
+        result2 = client.wrap_api_call(**wrap_kwargs)
 
         # Check if second call detected as duplicate
-        charge_result2 = getattr(result2, 'charge', None)
-        is_duplicate = getattr(charge_result2, 'is_duplicate', False) if charge_result2 else False
+        charge_result2 = get_field(result2, 'charge')
+        is_duplicate = get_field(charge_result2, 'is_duplicate', default=False)
 
         if is_duplicate:
             return CheckResult(
@@ -136,11 +130,10 @@ async def _wrap_api_call_idempotency_check(ctx: CheckContext) -> CheckResult:
         else:
             # Check if charge IDs match instead
             # WrapApiCallResult.charge is ChargeResult, ChargeResult.charge is ChargeInfo with id
-            charge_result1 = getattr(result1, 'charge', None)
-            charge_result2 = getattr(result2, 'charge', None)
-            charge_info1 = getattr(charge_result1, 'charge', None) if charge_result1 else None
-            charge_info2 = getattr(charge_result2, 'charge', None) if charge_result2 else None
-            if charge_info1 and charge_info2 and charge_info1.id == charge_info2.id:
+            charge_info1 = get_field(get_field(result1, 'charge'), 'charge')
+            charge_info2 = get_field(get_field(result2, 'charge'), 'charge')
+            if (charge_info1 is not None and charge_info2 is not None
+                    and get_field(charge_info1, 'id') == get_field(charge_info2, 'id')):
                 return CheckResult(
                     name="wrap_api_call_idempotency",
                     success=True,
@@ -182,7 +175,7 @@ async def _wrap_api_call_error_handling_check(ctx: CheckContext) -> CheckResult:
         )
 
     try:
-        client = create_client(ctx.api_key, ctx.api_url)
+        client = create_client(ctx.api_key, ctx.api_url, ctx.timeout)
 
         if not hasattr(client, 'wrap_api_call'):
             return CheckResult(
@@ -6,6 +6,7 @@ import click
 from dotenv import load_dotenv
 
 from .config import load_config
+from .drip_client import close_clients
 from .runner import run_checks
 from .reporter import Reporter
 from .types import CheckContext
@@ -66,7 +67,10 @@ def main(only, quick, verbose, json_output, environment, no_cleanup):
     reporter = Reporter(verbose=verbose, json_output=json_output)
 
     # Run checks
-    results = asyncio.run(run_checks(checks, context, reporter))
+    try:
+        results = asyncio.run(run_checks(checks, context, reporter))
+    finally:
+        close_clients()
 
     # Exit with appropriate code
     failures = sum(1 for r in results if not r.success)
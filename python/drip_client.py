@@ -1,6 +1,6 @@
 """SDK wrapper matching TypeScript version."""
-from typing import Optional, Any, Callable
-import uuid
+import os
+from typing import Optional, Any, Callable, Dict, Tuple
 
 # Import from drip-sdk package
 try:
@@ -15,13 +15,30 @@ except ImportError:
         DripSDK = None
         DripAuthenticationError = Exception
 
+# Older SDK versions don't ship a signature verifier
+try:
+    from drip import verify_webhook_signature
+except ImportError:
+    verify_webhook_signature = None
+
+
+# Clients keyed by (api_key, base_url, timeout_ms), shared by every check in a run
+_clients: Dict[Tuple[str, str, Optional[int]], Any] = {}
+
+# Sentinel for get_field, since None is a legitimate field value
+_MISSING = object()
+
 
-def create_client(api_key: str, base_url: str) -> Any:
-    """Create a Drip SDK client instance.
+def create_client(api_key: str, base_url: str, timeout_ms: Optional[int] = None) -> Any:
+    """Get a Drip SDK client instance.
+
+    Clients are cached per (api_key, base_url, timeout_ms) so all checks reuse
+    one HTTP connection pool instead of paying a new TLS handshake each time.
 
     Args:
         api_key: The Drip API key
         base_url: The API base URL
+        timeout_ms: HTTP timeout in milliseconds (SDK default if None)
 
     Returns:
         Configured Drip client instance
@@ -35,7 +52,64 @@ def create_client(api_key: str, base_url: str) -> Any:
     # Ensure URL is clean (remove trailing slash only)
     clean_url = base_url.rstrip("/")
 
-    return DripSDK(api_key=api_key, base_url=clean_url)
+    key = (api_key, clean_url, timeout_ms)
+    client = _clients.get(key)
+    if client is None:
+        if timeout_ms is None:
+            client = DripSDK(api_key=api_key, base_url=clean_url)
+        else:
+            client = DripSDK(api_key=api_key, base_url=clean_url, timeout=timeout_ms / 1000.0)
+        _clients[key] = client
+    return client
+
+
+def close_clients() -> None:
+    """Close all cached SDK clients and release their connection pools."""
+    try:
+        for client in _clients.values():
+            close = getattr(client, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    # Best-effort cleanup; never mask the run's exit code
+                    pass
+    finally:
+        _clients.clear()
+
+
+def get_field(obj: Any, *names: str, default: Any = None) -> Any:
+    """Read a field from an SDK response that may be a model or a plain dict.
+
+    Args:
+        obj: Response object or dict
+        names: Field names to try, in order
+        default: Value returned when none of the fields is present
+
+    Returns:
+        The value of the first field present, or default
+    """
+    is_dict = isinstance(obj, dict)
+    for name in names:
+        value = obj.get(name, _MISSING) if is_dict else getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def list_items(result: Any, field: str = 'data') -> Optional[list]:
+    """Extract the items from a list-endpoint response.
+
+    Args:
+        result: Response object or dict, or a bare list
+        field: Field holding the items on the response
+
+    Returns:
+        The list of items, or None if the response has no item list
+    """
+    if isinstance(result, list):
+        return result
+    return get_field(result, field)
 
 
 def generate_idempotency_key(prefix: str = "health_check") -> str:
@@ -47,7 +121,7 @@ def generate_idempotency_key(prefix: str = "health_check") -> str:
     Returns:
         Unique idempotency key string
     """
-    return f"{prefix}_{uuid.uuid4().hex}"
+    return f"{prefix}_{os.urandom(16).hex()}"
 
 
 def generate_external_id(prefix: str = "health_check") -> str:
@@ -59,4 +133,4 @@ def generate_external_id(prefix: str = "health_check") -> str:
     Returns:
         Unique external ID string
     """
-    return f"{prefix}_{uuid.uuid4().hex[:8]}"
+    return f"{prefix}_{os.urandom(4).hex()}"
@@ -0,0 +1,33 @@
+"""Shared fixtures for the Drip Python SDK tests."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from drip import AsyncDrip, Drip
+
+
+@pytest.fixture(scope="session")
+def api_key() -> str:
+    return "sk_test_edge_case_key"
+
+
+@pytest.fixture(scope="session")
+def base_url() -> str:
+    return "https://drip-app-hlunj.ondigitalocean.app/v1"
+
+
+@pytest.fixture(scope="session")
+def client(api_key: str, base_url: str) -> Iterator[Drip]:
+    # One client (and one HTTP connection pool) for the whole session;
+    # respx patches the transport, so mocked routes still apply per test.
+    drip = Drip(api_key=api_key, base_url=base_url)
+    yield drip
+    drip.close()
+
+
+@pytest.fixture
+def async_client(api_key: str, base_url: str) -> AsyncDrip:
+    return AsyncDrip(api_key=api_key, base_url=base_url)
@@ -29,31 +29,6 @@ from drip import (
 from drip.models import SpendingCapType
 
 
-# =============================================================================
-# Fixtures
-# =============================================================================
-
-
-@pytest.fixture
-def api_key() -> str:
-    return "sk_test_edge_case_key"
-
-
-@pytest.fixture
-def base_url() -> str:
-    return "https://drip-app-hlunj.ondigitalocean.app/v1"
-
-
-@pytest.fixture
-def client(api_key: str, base_url: str) -> Drip:
-    return Drip(api_key=api_key, base_url=base_url)
-
-
-@pytest.fixture
-def async_client(api_key: str, base_url: str) -> AsyncDrip:
-    return AsyncDrip(api_key=api_key, base_url=base_url)
-
-
 # =============================================================================
 # A. Constructor / Initialization Edge Cases
 # =============================================================================
@@ -62,12 +37,19 @@ def async_client(api_key: str, base_url: str) -> AsyncDrip:
 class TestConstructorEdgeCases:
     """Tests for SDK initialization with invalid or edge-case configurations."""
 
-    def test_a1_no_api_key_no_env_var(self) -> None:
-        """Company forgets to set env var in production."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},  # company forgets to set env var in production
+            {"api_key": None},  # explicitly passing None as API key
+        ],
+        ids=["a1_no_api_key", "a4_none_api_key"],
+    )
+    def test_a1_a4_missing_api_key_no_env_var(self, kwargs: dict) -> None:
+        """No usable API key from the param or the environment."""
         with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("DRIP_API_KEY", None)
             with pytest.raises(DripAuthenticationError):
-                Drip()
+                Drip(**kwargs)
 
     def test_a2_empty_string_api_key(self) -> None:
         """Misconfigured env var set to empty string."""
@@ -81,13 +63,6 @@ class TestConstructorEdgeCases:
         client = Drip(api_key="   ")
         assert client.config.api_key == "   "
 
-    def test_a4_none_api_key_no_env(self) -> None:
-        """Explicitly passing None as API key."""
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("DRIP_API_KEY", None)
-            with pytest.raises(DripAuthenticationError):
-                Drip(api_key=None)
-
     def test_a5_timeout_zero(self) -> None:
         """Company sets timeout=0 expecting 'no timeout'."""
         # Zero timeout should be accepted or use default
@@ -277,40 +252,27 @@ class TestCustomerEdgeCases:
         with pytest.raises(DripAPIError):
             client.get_customer(traversal)
 
-    @respx.mock
-    def test_b11_list_customers_limit_zero(self, client: Drip, base_url: str) -> None:
-        """limit=0 - below minimum of 1."""
-        respx.get(f"{base_url}/customers").mock(
-            return_value=httpx.Response(
-                422, json={"error": "limit must be >= 1", "code": "VALIDATION_ERROR"}
-            )
-        )
-        with pytest.raises(DripAPIError) as exc:
-            client.list_customers(limit=0)
-        assert exc.value.status_code == 422
-
-    @respx.mock
-    def test_b12_list_customers_limit_101(self, client: Drip, base_url: str) -> None:
-        """limit=101 - above maximum of 100."""
-        respx.get(f"{base_url}/customers").mock(
-            return_value=httpx.Response(
-                422, json={"error": "limit must be <= 100", "code": "VALIDATION_ERROR"}
-            )
-        )
-        with pytest.raises(DripAPIError) as exc:
-            client.list_customers(limit=101)
-        assert exc.value.status_code == 422
-
-    @respx.mock
-    def test_b13_list_customers_negative_limit(self, client: Drip, base_url: str) -> None:
-        """Negative limit value."""
+    @pytest.mark.parametrize(
+        ("limit", "error"),
+        [
+            (0, "limit must be >= 1"),  # below minimum of 1
+            (101, "limit must be <= 100"),  # above maximum of 100
+            (-1, "limit must be >= 1"),  # negative limit value
+        ],
+        ids=["b11_limit_zero", "b12_limit_101", "b13_negative_limit"],
+    )
+    @respx.mock
+    def test_b11_b13_list_customers_invalid_limit(
+        self, client: Drip, base_url: str, limit: int, error: str
+    ) -> None:
+        """Out-of-range limit values are rejected with 422."""
         respx.get(f"{base_url}/customers").mock(
             return_value=httpx.Response(
-                422, json={"error": "limit must be >= 1", "code": "VALIDATION_ERROR"}
+                422, json={"error": error, "code": "VALIDATION_ERROR"}
             )
         )
         with pytest.raises(DripAPIError) as exc:
-            client.list_customers(limit=-1)
+            client.list_customers(limit=limit)
         assert exc.value.status_code == 422
 
     @respx.mock
@@ -391,35 +353,33 @@ class TestChargeEdgeCases:
             client.charge(customer_id="cus_1", meter="api_calls", quantity=-5)
         assert exc.value.status_code == 422
 
-    @respx.mock
-    def test_c3_charge_nan_quantity(self, client: Drip, base_url: str) -> None:
-        """NaN quantity - BUG: Python json module outputs literal NaN which is invalid JSON.
-        httpx will fail to serialize the body because json.dumps(NaN) outputs 'NaN'
-        which is not valid JSON. This reveals a real bug in the SDK: no client-side
+    @pytest.mark.parametrize(
+        ("quantity", "error"),
+        [
+            (float("nan"), "quantity must be a number"),
+            (float("inf"), "quantity must be finite"),
+        ],
+        ids=["c3_nan", "c4_infinity"],
+    )
+    @respx.mock
+    def test_c3_c4_charge_non_finite_quantity(
+        self, client: Drip, base_url: str, quantity: float, error: str
+    ) -> None:
+        """NaN/Infinity quantity - BUG: Python json module outputs literal NaN/Infinity
+        which is invalid JSON. This reveals a real bug in the SDK: no client-side
         validation of NaN/Infinity values before sending."""
-        # Python's json module will serialize NaN as 'NaN' by default
+        # Python's json module will serialize these as 'NaN'/'Infinity' by default
         # httpx should send the request but the server will reject it
         respx.post(f"{base_url}/usage").mock(
             return_value=httpx.Response(
-                422, json={"error": "quantity must be a number", "code": "VALIDATION_ERROR"}
+                422, json={"error": error, "code": "VALIDATION_ERROR"}
             )
         )
         # This may either:
-        # 1. Send a request with NaN in body (server rejects with 422)
+        # 1. Send a request with NaN/Infinity in body (server rejects with 422)
         # 2. Raise a serialization error client-side
         with pytest.raises((DripAPIError, DripError, ValueError)):
-            client.charge(customer_id="cus_1", meter="api_calls", quantity=float("nan"))
-
-    @respx.mock
-    def test_c4_charge_infinity_quantity(self, client: Drip, base_url: str) -> None:
-        """Infinity quantity - same serialization issue as NaN."""
-        respx.post(f"{base_url}/usage").mock(
-            return_value=httpx.Response(
-                422, json={"error": "quantity must be finite", "code": "VALIDATION_ERROR"}
-            )
-        )
-        with pytest.raises((DripAPIError, DripError, ValueError)):
-            client.charge(customer_id="cus_1", meter="api_calls", quantity=float("inf"))
+            client.charge(customer_id="cus_1", meter="api_calls", quantity=quantity)
 
     @respx.mock
     def test_c5_charge_sub_cent_precision(self, client: Drip, base_url: str) -> None:
@@ -692,34 +652,25 @@ class TestWebhookEdgeCases:
         with pytest.raises(DripAPIError):
             client.create_webhook(url="https://example.com/hook", events=[])
 
-    @respx.mock
-    def test_d5_delete_nonexistent_webhook(self, client: Drip, base_url: str) -> None:
-        """Deleting already-deleted webhook returns 404."""
-        respx.delete(f"{base_url}/webhooks/nonexistent").mock(
-            return_value=httpx.Response(404, json={"error": "Webhook not found"})
-        )
-        with pytest.raises(DripAPIError) as exc:
-            client.delete_webhook("nonexistent")
-        assert exc.value.status_code == 404
-
-    @respx.mock
-    def test_d6_test_nonexistent_webhook(self, client: Drip, base_url: str) -> None:
-        """Testing nonexistent webhook returns 404."""
-        respx.post(f"{base_url}/webhooks/nonexistent/test").mock(
-            return_value=httpx.Response(404, json={"error": "Webhook not found"})
-        )
-        with pytest.raises(DripAPIError) as exc:
-            client.test_webhook("nonexistent")
-        assert exc.value.status_code == 404
-
-    @respx.mock
-    def test_d7_rotate_secret_nonexistent_webhook(self, client: Drip, base_url: str) -> None:
-        """Rotating secret of nonexistent webhook returns 404."""
-        respx.post(f"{base_url}/webhooks/nonexistent/rotate-secret").mock(
+    @pytest.mark.parametrize(
+        ("method", "path", "operation"),
+        [
+            ("DELETE", "", "delete_webhook"),  # already-deleted webhook
+            ("POST", "/test", "test_webhook"),
+            ("POST", "/rotate-secret", "rotate_webhook_secret"),
+        ],
+        ids=["d5_delete", "d6_test", "d7_rotate_secret"],
+    )
+    @respx.mock
+    def test_d5_d7_nonexistent_webhook(
+        self, client: Drip, base_url: str, method: str, path: str, operation: str
+    ) -> None:
+        """Operations on a nonexistent webhook return 404."""
+        respx.route(method=method, url=f"{base_url}/webhooks/nonexistent{path}").mock(
             return_value=httpx.Response(404, json={"error": "Webhook not found"})
         )
         with pytest.raises(DripAPIError) as exc:
-            client.rotate_webhook_secret("nonexistent")
+            getattr(client, operation)("nonexistent")
         assert exc.value.status_code == 404
 
 
@@ -1140,21 +1091,20 @@ class TestNetworkEdgeCases:
             client.list_customers()
         assert exc.value.status_code == 401
 
-    @respx.mock
-    def test_j8_timeout(self, client: Drip, base_url: str) -> None:
-        """Request timeout."""
-        respx.get(f"{base_url}/customers").mock(
-            side_effect=httpx.ReadTimeout("Timed out")
-        )
-        with pytest.raises(DripNetworkError):
-            client.list_customers()
-
-    @respx.mock
-    def test_j9_connection_refused(self, client: Drip, base_url: str) -> None:
-        """Connection refused (backend not running)."""
-        respx.get(f"{base_url}/customers").mock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ReadTimeout("Timed out"),  # request timeout
+            httpx.ConnectError("Connection refused"),  # backend not running
+        ],
+        ids=["j8_timeout", "j9_connection_refused"],
+    )
+    @respx.mock
+    def test_j8_j9_transport_errors(
+        self, client: Drip, base_url: str, error: httpx.TransportError
+    ) -> None:
+        """Transport failures surface as DripNetworkError."""
+        respx.get(f"{base_url}/customers").mock(side_effect=error)
         with pytest.raises(DripNetworkError):
             client.list_customers()
 